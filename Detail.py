@@ -13,6 +13,15 @@ class Detail:
         self.id: int = id
         self.to_rework: bool = False
         self.number_of_reworks: int = 0
+        self.arrival_time: float = 0  # Час надходження деталі у модель
+        self.departure_time: float = 0  # Час останнього переміщення деталі між системами
+
+    def get_cycle_time(self) -> float:
+        """
+        Час перебування деталі у моделі
+        :return: float
+        """
+        return self.departure_time - self.arrival_time
 
     def __repr__(self):
         return f"Detail id {self.id}, number_of_reworks {self.number_of_reworks}, is to rework {self.to_rework} "
@@ -1,15 +1,22 @@
-from typing import List
-
 from Element import Element
 from Detail import Detail
+from Histogram import Histogram
 class Disposer(Element):
     """
     Клас для збирання інформації про оброблені деталі та відходи
     """
-    def __init__(self):
+    def __init__(self,
+                 cycle_time_bin_width: float = 1.0
+                 ):
+        """
+
+        :param cycle_time_bin_width: початкова ширина інтервалу гістограми часу перебування деталей
+        """
         super().__init__()
-        self.processed_details: List[Detail] = []
-        self.wastes: List[Detail] = []
+        # Зберігаються лише лічильники, щоб пам'ять не зростала з тривалістю моделювання
+        self.processed_amount: int = 0
+        self.wastes_amount: int = 0
+        self.cycle_time_histogram: Histogram = Histogram(bin_width=cycle_time_bin_width)
 
     def receive_detail(self,
                        detail: Detail
@@ -19,7 +26,8 @@ class Disposer(Element):
         :param detail:
         :return:
         """
-        self.processed_details.append(detail)
+        self.processed_amount += 1
+        self.cycle_time_histogram.add(detail.get_cycle_time())
 
     def set_waste(self,
                   detail: Detail
@@ -29,4 +37,4 @@ class Disposer(Element):
         :param detail:
         :return:
         """
-        self.wastes.append(detail)
\ No newline at end of file
+        self.wastes_amount += 1
\ No newline at end of file
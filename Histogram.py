@@ -0,0 +1,143 @@
+from typing import Dict, Iterable
+
+import numpy as np
+
+
+class Histogram:
+    """
+    Зважена гістограма з фіксованими інтервалами для потокової оцінки розподілу величини.
+    Кількість інтервалів обмежена max_bins: при перевищенні ширина інтервалу подвоюється,
+    тому пам'ять не залежить від тривалості моделювання. Гістограми можна об'єднувати
+    """
+
+    def __init__(self,
+                 bin_width: float = 1.0,
+                 max_bins: int = 1024,
+                 interpolate: bool = True
+                 ):
+        """
+
+        :param bin_width: початкова ширина інтервалу
+        :param max_bins: максимальна кількість непорожніх інтервалів
+        :param interpolate: чи інтерполювати квантилі всередині інтервалу (для неперервних величин);
+            для цілих величин з одиничною шириною інтервалу без інтерполяції квантилі точні
+        """
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive")
+        if max_bins < 2:
+            raise ValueError("max_bins must be at least 2")
+
+        self.bin_width: float = bin_width
+        self.max_bins: int = max_bins
+        self.interpolate: bool = interpolate
+        self.bins: Dict[int, float] = {}  # Номер інтервалу -> накопичена вага
+        self.total_weight: float = 0
+        self.weighted_sum: float = 0
+
+    def add(self,
+            value: float,
+            weight: float = 1
+            ):
+        """
+        Додавання значення з вагою (для зважування за часом вагою є тривалість стану)
+        :param value: значення величини
+        :param weight: вага значення
+        :return: None
+        """
+        if weight <= 0:
+            return
+        index = int(value // self.bin_width)
+        self.bins[index] = self.bins.get(index, 0) + weight
+        self.total_weight += weight
+        self.weighted_sum += value * weight
+        if len(self.bins) > self.max_bins:
+            self._coarsen()
+
+    def _coarsen(self):
+        """
+        Подвоєння ширини інтервалів з об'єднанням сусідніх інтервалів
+        :return: None
+        """
+        bins = {}
+        for index, weight in self.bins.items():
+            bins[index // 2] = bins.get(index // 2, 0) + weight
+        self.bins = bins
+        self.bin_width *= 2
+
+    def merge(self,
+              other: "Histogram"
+              ) -> "Histogram":
+        """
+        Об'єднання з гістограмою іншого прогону. Ширини інтервалів мають відрізнятися у 2^k разів
+        :param other: гістограма для об'єднання
+        :return: Histogram
+        """
+        other_bins = other.bins
+        other_width = other.bin_width
+        while other_width < self.bin_width and not np.isclose(other_width, self.bin_width):
+            coarse_bins = {}
+            for index, weight in other_bins.items():
+                coarse_bins[index // 2] = coarse_bins.get(index // 2, 0) + weight
+            other_bins = coarse_bins
+            other_width *= 2
+        while self.bin_width < other_width and not np.isclose(other_width, self.bin_width):
+            self._coarsen()
+        if not np.isclose(other_width, self.bin_width):
+            raise ValueError("Histograms with incompatible bin widths cannot be merged")
+
+        for index, weight in other_bins.items():
+            self.bins[index] = self.bins.get(index, 0) + weight
+        self.total_weight += other.total_weight
+        self.weighted_sum += other.weighted_sum
+        while len(self.bins) > self.max_bins:
+            self._coarsen()
+        return self
+
+    def mean(self) -> float:
+        """
+        Зважене середнє значення
+        :return: float
+        """
+        return self.weighted_sum / self.total_weight if self.total_weight else np.nan
+
+    def quantile(self,
+                 q: float
+                 ) -> float:
+        """
+        Оцінка квантиля лінійною інтерполяцією всередині інтервалу, що містить заданий рівень,
+        або нижньою межею цього інтервалу, якщо interpolate=False.
+        Справжній квантиль лежить у тому самому інтервалі, тому похибка менша за поточну bin_width
+        :param q: рівень квантиля від 0 до 1
+        :return: float
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.total_weight:
+            return np.nan
+
+        target = q * self.total_weight
+        cumulative = 0
+        indices = sorted(self.bins)
+        for index in indices:
+            weight = self.bins[index]
+            if cumulative + weight >= target:
+                if not self.interpolate:
+                    return index * self.bin_width
+                return (index + (target - cumulative) / weight) * self.bin_width
+            cumulative += weight
+        return (indices[-1] + self.interpolate) * self.bin_width
+
+    def quantiles(self,
+                  levels: Iterable[float] = (0.5, 0.95, 0.99)
+                  ) -> Dict[str, float]:
+        """
+        Набір квантилів у вигляді {"p50": ..., "p95": ..., "p99": ...}
+        :param levels: рівні квантилів
+        :return: dict
+        """
+        return {f"p{round(level * 100):g}": self.quantile(level) for level in levels}
+
+    def __repr__(self):
+        return (f"Histogram bin width: {self.bin_width}, "
+                f"bins: {len(self.bins)}, "
+                f"total weight: {self.total_weight}")
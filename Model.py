@@ -1,5 +1,4 @@
 import random
-import time
 
 from collections import defaultdict
 from typing import Type, List, Dict
@@ -79,6 +78,8 @@ class Model:
                 if receiver_system.type == "reworker":
                     detail.to_rework = True
 
+                detail.departure_time = self.current_time
+
                 if detail.number_of_reworks == 1 and detail.to_rework:
                     self.disposer.set_waste(detail)
                     continue
@@ -140,32 +141,104 @@ class Model:
         for system in self.systems:
             print(system)
 
-    def statistical_report(self):
+    def statistical_report(self, verbose: bool = True):
         workloads = []
         for system in self.systems:
-            workloads.append(system.statistical_report(self.current_time))
-        print("Total detail amount: ", self.generator.element_id)
-        print("Total processed details ", len(self.disposer.processed_details))
-        print("Total wastes", len(self.disposer.wastes))
-
-        results = {"processed": len(self.disposer.processed_details),
-                   "wastes": len(self.disposer.wastes),
-                   "workloads": workloads}
+            workloads.append(system.statistical_report(self.current_time, verbose))
+        if verbose:
+            print("Total detail amount: ", self.generator.element_id)
+            print("Total processed details ", self.disposer.processed_amount)
+            print("Total wastes", self.disposer.wastes_amount)
+            print("Cycle time quantiles", self.disposer.cycle_time_histogram.quantiles(),
+                  "+-", self.disposer.cycle_time_histogram.bin_width)
+
+        results = {"processed": self.disposer.processed_amount,
+                   "wastes": self.disposer.wastes_amount,
+                   "workloads": workloads,
+                   "queue_size_quantiles": [system.queue_size_histogram.quantiles() for system in self.systems],
+                   "cycle_time_quantiles": self.disposer.cycle_time_histogram.quantiles(),
+                   # Гістограми для об'єднання результатів паралельних прогонів
+                   "queue_size_histograms": [system.queue_size_histogram for system in self.systems],
+                   "cycle_time_histogram": self.disposer.cycle_time_histogram}
 
         return results
 
-    def simulate(self, simulation_time: float):
+    def snapshot(self):
+        """
+        Легкий знімок поточного стану моделі без копіювання її об'єктів
+        :return: dict
+        """
+        systems = []
+        for system in self.systems:
+            systems.append({"type": system.type,
+                            "queue_size": system.get_queue_size(),
+                            "successes": system.successes,
+                            "failures": system.failures,
+                            "workload": system.get_current_workload(self.current_time)})
+
+        return {"time": self.current_time,
+                "generated": self.generator.element_id,
+                "processed": self.disposer.processed_amount,
+                "wastes": self.disposer.wastes_amount,
+                "systems": systems}
+
+    def simulate_iter(self,
+                      simulation_time: float,
+                      time_step: float = None,
+                      events_step: int = None
+                      ):
+        """
+        Покрокове моделювання, що повертає знімки стану кожні time_step одиниць модельного часу
+        або кожні events_step подій. Останній знімок повертається по завершенню моделювання.
+        Якщо моделювання перервано, накопичену статистику можна отримати через statistical_report,
+        який не змінює стан моделі, тому моделювання після нього можна продовжити
+        :param simulation_time: час моделювання
+        :param time_step: інтервал модельного часу між знімками
+        :param events_step: кількість подій між знімками
+        :return: генератор знімків стану моделі
+        """
+        if time_step is not None and time_step <= 0:
+            raise ValueError("time_step must be positive")
+        if events_step is not None and events_step <= 0:
+            raise ValueError("events_step must be positive")
+
+        next_snapshot_time = self.current_time + time_step if time_step is not None else np.inf
+        events = 0
 
         while self.current_time < simulation_time:
+            # Розміри черг фіксуються до події, бо саме вони діяли протягом інтервалу до неї
+            queue_sizes = [system.get_queue_size() for system in self.systems]
             passed_time = self.make_step()
+            for system, queue_size in zip(self.systems, queue_sizes):
+                system.gather_statistics(queue_size, passed_time)
+            # Час оновлюється до маршрутизації, щоб деталі отримували час події, на якій вони переміщуються
+            self.current_time += passed_time
             self.route_detail()
             self.update(passed_time)
-            self.current_time += passed_time
+            events += 1
             #self.log()
-        return self.statistical_report()
+
+            if self.current_time >= simulation_time:
+                break
+
+            if self.current_time >= next_snapshot_time or (events_step is not None and events >= events_step):
+                events = 0
+                while next_snapshot_time <= self.current_time:
+                    next_snapshot_time += time_step
+                yield self.snapshot()
+
+        yield self.snapshot()
+
+    def simulate(self, simulation_time: float, verbose: bool = True):
+
+        for _ in self.simulate_iter(simulation_time):
+            pass
+        return self.statistical_report(verbose)
 
     def handle_input(self):
+        arrival_time = self.current_time + self.generator.get_next_event_time()
         detail = self.generator.process()
+        detail.arrival_time = arrival_time
         idx = 1 if np.random.rand() < 0.5 else 0
         self.systems[idx].receive_detail(detail)
 
@@ -4,8 +4,7 @@ import numpy as np
 from Detail import Detail
 from Server import Server
 from Element import Element
-
-np.random.exponential()
+from Histogram import Histogram
 
 
 class System(Element):
@@ -46,6 +45,7 @@ class System(Element):
         self.successes: int = 0
         self.workload: float = 0
         self.mean_queue_size: float = 0
+        self.queue_size_histogram: Histogram = Histogram(bin_width=1, interpolate=False)  # Розподіл розміру черги, зважений за часом
 
     def get_next_event_time(self) -> float:
         """
@@ -75,26 +75,41 @@ class System(Element):
             elif server.current_detail is None:
                 detail = self._queue_get()
                 server.set_detail(detail)
-        self.gather_statistics(time_diff)
+
     def statistical_report(self,
-                           modeling_time: float
+                           modeling_time: float,
+                           verbose: bool = True
                            ):
         """
-        Отримання статистичних даних системи
+        Отримання статистичних даних системи. Завантаження обчислюється заново при кожному виклику,
+        тому звіт можна отримувати і під час моделювання
         :param modeling_time: час моделювання
+        :param verbose: чи виводити статистику у консоль
         :return workload:
         """
-        for server in self.servers:
-            self.workload += server.work_time
-        self.workload = self.workload / modeling_time / len(self.servers)
-        print("----------------")
-        print(f"System: {self.type}\n"
-              f"workload: {self.workload},"
-              f"mean queue size: {self.mean_queue_size / modeling_time},"
-              f"successes: {self.successes}, failures: {self.failures} ")
+        self.workload = self.get_current_workload(modeling_time)
+        if verbose:
+            print("----------------")
+            print(f"System: {self.type}\n"
+                  f"workload: {self.workload},"
+                  f"mean queue size: {self.mean_queue_size / modeling_time},"
+                  f"queue size quantiles: {self.queue_size_histogram.quantiles()},"
+                  f"successes: {self.successes}, failures: {self.failures} ")
 
         return self.workload
 
+    def get_current_workload(self,
+                             modeling_time: float
+                             ) -> float:
+        """
+        Отримання поточного завантаження системи без зміни накопиченої статистики
+        :param modeling_time: поточний час моделювання
+        :return: float
+        """
+        if modeling_time <= 0:
+            return 0
+        return sum(server.work_time for server in self.servers) / modeling_time / len(self.servers)
+
     def process(self) -> float:
         """
         Обробка деталі з найменшим часом обробки
@@ -103,7 +118,6 @@ class System(Element):
         passed_time = self.next_event.process()
         detail = self.next_event.get_detail_out()
         self.successes += 1
-        self.gather_statistics(passed_time)
         self.detail_to_move = detail
 
         return passed_time
@@ -138,14 +152,18 @@ class System(Element):
         return self.queue.qsize()
 
     def gather_statistics(self,
+                          queue_size: int,
                           passed_time: float
                           ):
         """
-        Збір інформації про середній розмір черги системи
-        :param passed_time:
+        Збір інформації про середній розмір черги системи та його розподіл.
+        Викликається моделлю один раз на кожен інтервал між подіями
+        :param queue_size: розмір черги протягом інтервалу
+        :param passed_time: тривалість інтервалу
         :return:
         """
-        self.mean_queue_size += self.queue.qsize() * passed_time
+        self.mean_queue_size += queue_size * passed_time
+        self.queue_size_histogram.add(queue_size, passed_time)
 
     def _queue_get(self):
         """
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import time
+
+
+def measure_startup(statement, repeats=5):
+    """
+    Мінімальний час запуску нового процесу інтерпретатора, що виконує statement
+    :param statement: код для виконання
+    :param repeats: кількість повторень
+    :return: float
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def measure_simulation(simulation_time=100_000, repeats=5):
+    """
+    Середній час одного прогону моделі без виводу звіту
+    :param simulation_time: час моделювання
+    :param repeats: кількість повторень
+    :return: float
+    """
+    import utils
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        utils.create_model(3).simulate(simulation_time=simulation_time, verbose=False)
+    return (time.perf_counter() - start) / repeats
+
+
+if __name__ == "__main__":
+    statements = {
+        "Interpreter startup": "pass",
+        "import Model": "import Model",
+        "import utils": "import utils",
+        "cli simulate --time 1000": "import cli; cli.main(['--quiet', 'simulate', '--time', '1000'])",
+    }
+    for name, statement in statements.items():
+        print(f"{name}: {measure_startup(statement):.4f} s")
+    print(f"simulate(100_000): {measure_simulation():.4f} s")
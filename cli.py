@@ -0,0 +1,121 @@
+import argparse
+import json
+
+
+def _parse_params(value):
+    return [int(param) for param in value.split(",")]
+
+
+def _seed(seed):
+    # Модулі моделі імпортуються лише після розбору аргументів, щоб `--help` працював миттєво
+    if seed is not None:
+        import random
+        import numpy as np
+
+        random.seed(seed)
+        np.random.seed(seed)
+
+
+def run_simulate(args):
+    import utils
+
+    model = utils.create_model(args.param)
+    run_res = model.simulate(simulation_time=args.time, verbose=not args.quiet)
+    if args.quiet:
+        # Компактний підсумок одним рядком для обробки результатів робочих процесів
+        print(json.dumps({"processed": run_res["processed"],
+                          "wastes": run_res["wastes"],
+                          "workloads": run_res["workloads"]}))
+
+
+def run_sweep(args):
+    import utils
+
+    utils.sweep(args.time, param_values=args.params, RUNS=args.runs, verbose=not args.quiet)
+
+
+def run_anova(args):
+    import utils
+
+    utils.ANOVA(RUNS=args.runs, param_values=args.params, sim_time=args.time, verbose=not args.quiet)
+
+
+def run_compare(args):
+    import utils
+
+    utils.compare_models(args.time, runs=args.runs, verbose=not args.quiet)
+
+
+def run_select(args):
+    import utils
+
+    if args.target == "layout":
+        alternatives = utils.layout_alternatives(args.param)
+    else:
+        alternatives = utils.threshold_alternatives(args.params)
+    utils.OCBA(alternatives, sim_time=args.time, objective=args.objective, maximize=not args.minimize,
+               n0=args.n0, step=args.step, max_budget=args.budget, confidence=args.confidence,
+               verbose=not args.quiet)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Моделювання системи обробки деталей")
+    parser.add_argument("--seed", type=int, default=None, help="зерно генераторів випадкових чисел")
+    parser.add_argument("--quiet", action="store_true", help="не виводити звіт кожного прогону")
+
+    # Ті самі параметри приймаються і після назви команди; SUPPRESS не перезаписує значення, задані перед нею
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seed", type=int, default=argparse.SUPPRESS, help="зерно генераторів випадкових чисел")
+    common.add_argument("--quiet", action="store_true", default=argparse.SUPPRESS,
+                        help="не виводити звіт кожного прогону")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    simulate = subparsers.add_parser("simulate", parents=[common], help="один прогін моделі")
+    simulate.add_argument("--time", type=float, default=100_000, help="час моделювання")
+    simulate.add_argument("--param", type=int, default=3, help="поріг активації вторинного верстату")
+    simulate.set_defaults(func=run_simulate)
+
+    sweep = subparsers.add_parser("sweep", parents=[common], help="середні значення для кожного порогу активації")
+    sweep.add_argument("--time", type=float, default=100_000, help="час моделювання")
+    sweep.add_argument("--params", type=_parse_params, default=[1, 2, 3, 4, 5], help="пороги через кому")
+    sweep.add_argument("--runs", type=int, default=20, help="кількість прогонів для кожного порогу")
+    sweep.set_defaults(func=run_sweep)
+
+    anova = subparsers.add_parser("anova", parents=[common], help="дисперсійний аналіз впливу порогу активації")
+    anova.add_argument("--time", type=float, default=100_000, help="час моделювання")
+    anova.add_argument("--params", type=_parse_params, default=[1, 2, 3, 4, 5], help="пороги через кому")
+    anova.add_argument("--runs", type=int, default=20, help="кількість прогонів для кожного порогу")
+    anova.set_defaults(func=run_anova)
+
+    compare = subparsers.add_parser("compare", parents=[common], help="порівняння стандартної та зміненої моделей")
+    compare.add_argument("--time", type=float, default=1_000_000, help="час моделювання")
+    compare.add_argument("--runs", type=int, default=20, help="кількість прогонів кожної моделі")
+    compare.set_defaults(func=run_compare)
+
+    select = subparsers.add_parser("select", parents=[common], help="вибір найкращої конфігурації методом OCBA")
+    select.add_argument("--target", choices=["threshold", "layout"], default="threshold",
+                        help="порівнювати пороги активації або схеми моделі")
+    select.add_argument("--time", type=float, default=100_000, help="час моделювання")
+    select.add_argument("--params", type=_parse_params, default=[1, 2, 3, 4, 5], help="пороги через кому")
+    select.add_argument("--param", type=int, default=3, help="поріг активації для порівняння схем")
+    select.add_argument("--objective", choices=["processed", "wastes"], default="processed",
+                        help="показник для порівняння")
+    select.add_argument("--minimize", action="store_true", help="мінімізувати показник")
+    select.add_argument("--n0", type=int, default=5, help="початкова кількість прогонів кожної альтернативи")
+    select.add_argument("--step", type=int, default=10, help="кількість прогонів за один крок")
+    select.add_argument("--budget", type=int, default=500, help="максимальна кількість прогонів")
+    select.add_argument("--confidence", type=float, default=0.95, help="бажана ймовірність правильного вибору")
+    select.set_defaults(func=run_select)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    _seed(args.seed)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from Histogram import Histogram
+
+
+def test_add_accumulates_weights():
+    histogram = Histogram(bin_width=1)
+    histogram.add(0, 2.5)
+    histogram.add(3, 1.5)
+    histogram.add(3, 0)
+
+    assert histogram.bins == {0: 2.5, 3: 1.5}
+    assert histogram.total_weight == 4
+    assert np.isclose(histogram.mean(), 4.5 / 4)
+
+
+def test_coarsen_keeps_total_weight_and_bounds_bins():
+    histogram = Histogram(bin_width=1, max_bins=8)
+    for value in range(100):
+        histogram.add(value)
+
+    assert len(histogram.bins) <= 8
+    assert histogram.bin_width == 16
+    assert histogram.total_weight == 100
+    assert sum(histogram.bins.values()) == 100
+
+
+def test_quantile_interpolates_within_bin():
+    histogram = Histogram(bin_width=10)
+    histogram.add(5, 1)
+    histogram.add(15, 1)
+
+    assert np.isclose(histogram.quantile(0.5), 10)
+    assert np.isclose(histogram.quantile(0.75), 15)
+    assert np.isnan(Histogram().quantile(0.5))
+
+
+def test_discrete_quantiles_of_empty_queue():
+    histogram = Histogram(bin_width=1, interpolate=False)
+    histogram.add(0, 100)
+
+    assert histogram.quantiles() == {"p50": 0, "p95": 0, "p99": 0}
+
+
+def test_discrete_quantiles_are_exact_for_integers():
+    histogram = Histogram(bin_width=1, interpolate=False)
+    histogram.add(0, 90)
+    histogram.add(2, 6)
+    histogram.add(5, 4)
+
+    assert histogram.quantiles() == {"p50": 0, "p95": 2, "p99": 5}
+
+
+def test_merge_coarsened_into_fine():
+    fine = Histogram(bin_width=1)
+    coarse = Histogram(bin_width=1, max_bins=8)
+    samples = np.random.default_rng(0).uniform(0, 100, 1000)
+    for value in samples[:500]:
+        fine.add(value)
+    for value in samples[500:]:
+        coarse.add(value)
+
+    fine.merge(coarse)
+
+    assert fine.bin_width == coarse.bin_width
+    assert fine.total_weight == 1000
+    assert np.isclose(sum(fine.bins.values()), 1000)
+    assert np.isclose(fine.mean(), np.mean(samples))
+    for level in (0.5, 0.95, 0.99):
+        assert abs(fine.quantile(level) - np.quantile(samples, level)) < fine.bin_width
+
+
+def test_merge_incompatible_widths():
+    histogram = Histogram(bin_width=1)
+    histogram.add(1)
+    other = Histogram(bin_width=3)
+    other.add(1)
+    with pytest.raises(ValueError):
+        histogram.merge(other)
@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+import pytest
+
+import utils
+
+
+def _create_model(seed=0):
+    random.seed(seed)
+    np.random.seed(seed)
+    return utils.create_model(3)
+
+
+def _events(snapshot):
+    # Кожна подія - це надходження нової деталі або завершення обробки в одній із систем
+    return snapshot["generated"] + sum(system["successes"] for system in snapshot["systems"])
+
+
+def test_time_step_snapshots_are_ordered_with_single_final():
+    simulation_time = 20_000
+    snapshots = list(_create_model().simulate_iter(simulation_time, time_step=1_000))
+
+    times = [snapshot["time"] for snapshot in snapshots]
+    assert times == sorted(times)
+    assert len(snapshots) > 1
+    assert sum(time >= simulation_time for time in times) == 1
+    assert times[-1] >= simulation_time
+    for i, time in enumerate(times[:-1]):
+        assert time >= (i + 1) * 1_000
+
+
+def test_without_steps_only_final_snapshot():
+    snapshots = list(_create_model().simulate_iter(5_000))
+
+    assert len(snapshots) == 1
+    assert snapshots[0]["time"] >= 5_000
+
+
+def test_events_step_sets_spacing():
+    snapshots = list(_create_model().simulate_iter(20_000, events_step=50))
+
+    events = [_events(snapshot) for snapshot in snapshots]
+    assert len(events) > 2
+    assert events[0] == 50
+    assert all(later - earlier == 50 for earlier, later in zip(events[:-2], events[1:-1]))
+    assert 0 < events[-1] - events[-2] <= 50
+
+
+@pytest.mark.parametrize("kwargs", [{"time_step": 0}, {"time_step": -1}, {"events_step": 0}, {"events_step": -5}])
+def test_non_positive_steps_raise(kwargs):
+    with pytest.raises(ValueError):
+        next(_create_model().simulate_iter(1_000, **kwargs))
+
+
+def test_close_early_keeps_partial_statistics():
+    model = _create_model()
+    iterator = model.simulate_iter(1e9, events_step=100)
+    for i, snapshot in enumerate(iterator):
+        if i == 2:
+            break
+    iterator.close()
+
+    assert model.current_time < 1e9
+    first = model.statistical_report(verbose=False)
+    second = model.statistical_report(verbose=False)
+    assert first["processed"] == snapshot["processed"]
+    assert first["workloads"] == second["workloads"]
+    assert first["workloads"] == [system["workload"] for system in snapshot["systems"]]
+
+
+def test_mean_queue_size_matches_histogram():
+    model = _create_model()
+    model.simulate(20_000, verbose=False)
+
+    for system in model.systems:
+        assert np.isclose(system.queue_size_histogram.total_weight, model.current_time)
+        assert np.isclose(system.mean_queue_size / model.current_time, system.queue_size_histogram.mean())
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import utils
+
+
+def test_ocba_targets_match_hand_computed_allocation():
+    means = np.array([10.0, 8.0, 6.0])
+    sigmas = np.array([1.0, 1.0, 2.0])
+
+    targets = utils._ocba_targets(means, sigmas, 0, 100)
+
+    # N_i ~ (sigma_i / delta_i)^2: (1 / 2)^2 = 0.25, (2 / 4)^2 = 0.25
+    # N_b = sigma_b * sqrt(sum(N_i^2 / sigma_i^2)) = sqrt(0.25^2 / 1 + 0.25^2 / 4) = sqrt(0.078125)
+    ratios = np.array([np.sqrt(0.078125), 0.25, 0.25])
+    assert np.allclose(targets, 100 * ratios / ratios.sum())
+    assert np.isclose(targets.sum(), 100)
+
+
+def test_pcs_is_half_for_tied_means():
+    pcs = utils._probability_of_correct_selection(np.array([5.0, 5.0]), np.array([1.0, 1.0]),
+                                                  np.array([10, 10]), 0)
+
+    assert np.isclose(pcs, 0.5)
+
+
+def test_pcs_approaches_one_for_separated_means():
+    pcs = utils._probability_of_correct_selection(np.array([10.0, 0.0, 1.0]), np.array([1.0, 1.0, 1.0]),
+                                                  np.array([10, 10, 10]), 0)
+
+    assert pcs > 0.999
+
+
+def _not_simulated():
+    raise AssertionError("no replication should run")
+
+
+@pytest.mark.parametrize("kwargs", [{"step": 0}, {"step": -1}, {"confidence": 0}, {"confidence": 1},
+                                    {"objective": "workloads"}, {"n0": 1}, {"max_budget": 3}])
+def test_ocba_validates_arguments_before_running(kwargs):
+    alternatives = {"a": _not_simulated, "b": _not_simulated}
+
+    with pytest.raises(ValueError):
+        utils.OCBA(alternatives, **kwargs)
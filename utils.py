@@ -1,10 +1,11 @@
 
-import pandas as pd
-from scipy.stats import f_oneway
+import math
+
 import numpy as np
 
 from Disposer import Disposer
 from Generator import Generator
+from Histogram import Histogram
 from Model import Model
 from System import System
 
@@ -43,21 +44,30 @@ def create_model(param):
     model.bind(secondary_system_1, secondary_system_2)
     return model
 
-def get_mean_stats(sim_time, param =3):
+
+def create_swapped_model(param):
+    # Змінена модель: верстати первинної обробки міняються ролями
+    model = create_model(param)
+    model.systems[0].type, model.systems[1].type = model.systems[1].type, model.systems[0].type
+    return model
+
+def get_mean_stats(sim_time, param =3, RUNS=20, verbose=True):
     processed_runs = []
     wastes_runs = []
     workloads_runs = []
+    cycle_time_histogram = Histogram()
 
-    RUNS = 20
     for i in range(RUNS):
         # Створюємо новий об'єкт моделі в кожній ітерації (якщо це потрібно)
         model = create_model(param)
-        run_res = model.simulate(simulation_time=sim_time)
+        run_res = model.simulate(simulation_time=sim_time, verbose=verbose)
 
         # Зберігаємо результати кожного прогону
         processed_runs.append(run_res["processed"])
         wastes_runs.append(run_res["wastes"])
         workloads_runs.append(run_res["workloads"])
+        # Об'єднуємо гістограми часу перебування деталей усіх прогонів
+        cycle_time_histogram.merge(run_res["cycle_time_histogram"])
 
     # Обчислення середніх значень та стандартних відхилень (сигм)
     mean_processed = np.mean(processed_runs)
@@ -74,17 +84,35 @@ def get_mean_stats(sim_time, param =3):
     print(f"Processed details: {mean_processed} +- {sigma_processed}")
     print(f"Wastes: {mean_wastes} +- {sigma_wastes}")
     print(f"Workloads for servers: {mean_workloads} +- {sigma_workloads}")
+    print(f"Cycle time quantiles over all runs: {cycle_time_histogram.quantiles()}")
     print("-" * 10)
 
+    return {"processed": (mean_processed, sigma_processed),
+            "wastes": (mean_wastes, sigma_wastes),
+            "workloads": (mean_workloads, sigma_workloads),
+            "cycle_time_quantiles": cycle_time_histogram.quantiles()}
+
+
+def sweep(sim_time, param_values=[1, 2, 3, 4, 5], RUNS=20, verbose=True):
+    results = {}
+    for param in param_values:
+        print(f"activation_threshold = {param}")
+        results[param] = get_mean_stats(sim_time, param, RUNS, verbose)
+    return results
+
+
+def ANOVA(RUNS=20, param_values=[1, 2, 3, 4, 5], sim_time=100_000, verbose=True):
+    # Бібліотеки аналізу імпортуються лише за потреби, щоб не сповільнювати запуск моделювання
+    import pandas as pd
+    from scipy.stats import f_oneway
 
-def ANOVA(RUNS=20, param_values=[1, 2, 3, 4, 5]):
     data = []
 
     for param in param_values:
         for i in range(RUNS):
 
             model = create_model(param)
-            run_res = model.simulate(simulation_time=100_000)
+            run_res = model.simulate(simulation_time=sim_time, verbose=verbose)
 
             # Додаємо результати у вигляді рядка у data
             data.append({
@@ -114,7 +142,10 @@ def ANOVA(RUNS=20, param_values=[1, 2, 3, 4, 5]):
     print(f"ANOVA results for processed details: F={f_stat}, p={p_val}")
 
 
-def compare_models(simulation_time, runs=20):
+def compare_models(simulation_time, runs=20, verbose=True):
+    import pandas as pd
+    from scipy.stats import f_oneway
+
     # Ініціалізуємо змінні для зберігання результатів
     results_model1 = {'processed': [], 'wastes': []}
     results_model2 = {'processed': [], 'wastes': []}
@@ -124,15 +155,14 @@ def compare_models(simulation_time, runs=20):
 
         model1 = create_model(3)
 
-        model2 = create_model(3)
-        model2.systems[0].type, model2.systems[1].type = model2.systems[1].type, model2.systems[0].type
+        model2 = create_swapped_model(3)
 
-        run_res1 = model1.simulate(simulation_time=simulation_time)
+        run_res1 = model1.simulate(simulation_time=simulation_time, verbose=verbose)
         results_model1['processed'].append(run_res1['processed'])
         results_model1['wastes'].append(run_res1['wastes'])
 
         # Прогін для моделі 2
-        run_res2 = model2.simulate(simulation_time=simulation_time)
+        run_res2 = model2.simulate(simulation_time=simulation_time, verbose=verbose)
         results_model2['processed'].append(run_res2['processed'])
         results_model2['wastes'].append(run_res2['wastes'])
 
@@ -157,3 +187,116 @@ def compare_models(simulation_time, runs=20):
         # Виводимо результати аналізу
         print(f"\nParameter: {param}")
         print(f"F-value: {f_value:.4f}, p-value: {p_value:.4f}")
+
+
+def threshold_alternatives(param_values=[1, 2, 3, 4, 5]):
+    return {f"activation_threshold={param}": (lambda param=param: create_model(param)) for param in param_values}
+
+
+def layout_alternatives(param=3):
+    return {"standard": lambda: create_model(param),
+            "swapped": lambda: create_swapped_model(param)}
+
+
+def _probability_of_correct_selection(means, sigmas, runs, best):
+    # Нижня оцінка Бонферроні для ймовірності правильного вибору за нормального наближення
+    pcs = 1.0
+    for i in range(len(means)):
+        if i == best:
+            continue
+        std_error = math.sqrt(sigmas[best] ** 2 / runs[best] + sigmas[i] ** 2 / runs[i])
+        z = abs(means[best] - means[i]) / std_error
+        pcs -= 0.5 * math.erfc(z / math.sqrt(2))
+    return max(pcs, 0.0)
+
+
+def _ocba_targets(means, sigmas, best, total):
+    # Оптимальний розподіл прогонів OCBA (Chen et al., 2000) для заданого загального бюджету
+    differences = np.maximum(np.abs(means[best] - means), 1e-9)
+    ratios = (sigmas / differences) ** 2
+    others = np.arange(len(means)) != best
+    ratios[best] = sigmas[best] * np.sqrt(np.sum(ratios[others] ** 2 / sigmas[others] ** 2))
+    return total * ratios / np.sum(ratios)
+
+
+# Скалярні показники statistical_report, за якими можна порівнювати конфігурації
+OCBA_OBJECTIVES = ["processed", "wastes"]
+
+
+def OCBA(alternatives, sim_time=100_000, objective="processed", maximize=True,
+         n0=5, step=10, max_budget=500, confidence=0.95, verbose=False):
+    """
+    Вибір найкращої конфігурації моделі методом OCBA (Optimal Computing Budget Allocation).
+    Після n0 початкових прогонів кожної альтернативи нові прогони виділяються порціями по step
+    тим альтернативам, що найбільше впливають на ймовірність правильного вибору. Пошук зупиняється,
+    коли ця ймовірність досягає confidence або вичерпано max_budget прогонів
+    :param alternatives: словник назва -> функція, що створює модель
+    :param sim_time: час моделювання одного прогону
+    :param objective: показник зі statistical_report для порівняння, один із OCBA_OBJECTIVES
+    :param maximize: чи максимізувати показник
+    :param n0: початкова кількість прогонів кожної альтернативи
+    :param step: кількість прогонів, що розподіляються за один крок
+    :param max_budget: максимальна загальна кількість прогонів
+    :param confidence: бажана ймовірність правильного вибору
+    :param verbose: чи виводити звіт кожного прогону
+    :return: dict
+    """
+    names = list(alternatives)
+    if objective not in OCBA_OBJECTIVES:
+        raise ValueError(f"objective must be one of {OCBA_OBJECTIVES}, got {objective!r}")
+    if len(names) < 2:
+        raise ValueError("At least two alternatives are required")
+    if n0 < 2:
+        raise ValueError("n0 must be at least 2 to estimate variances")
+    if step < 1:
+        raise ValueError("step must be at least 1")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if n0 * len(names) > max_budget:
+        raise ValueError("max_budget is too small for the initial runs")
+
+    sign = 1 if maximize else -1
+    samples = [[] for _ in names]
+
+    def run(i):
+        run_res = alternatives[names[i]]().simulate(simulation_time=sim_time, verbose=verbose)
+        samples[i].append(run_res[objective])
+
+    for i in range(len(names)):
+        for _ in range(n0):
+            run(i)
+
+    while True:
+        runs = np.array([len(sample) for sample in samples])
+        means = np.array([np.mean(sample) for sample in samples])
+        # Нульова дисперсія можлива для коротких прогонів, тому обмежуємо її знизу
+        sigmas = np.maximum(np.array([np.std(sample, ddof=1) for sample in samples]), 1e-9)
+        best = int(np.argmax(sign * means))
+        pcs = _probability_of_correct_selection(means, sigmas, runs, best)
+
+        used = int(np.sum(runs))
+        if pcs >= confidence or used >= max_budget:
+            break
+
+        allocation = min(step, max_budget - used)
+        targets = _ocba_targets(means, sigmas, best, used + allocation)
+        planned = runs.astype(float)
+        for _ in range(allocation):
+            i = int(np.argmax(targets - planned))
+            planned[i] += 1
+            run(i)
+
+    results = {"best": names[best],
+               "pcs": pcs,
+               "budget": used,
+               "runs": dict(zip(names, runs.tolist())),
+               "means": dict(zip(names, means.tolist()))}
+
+    print("-" * 10)
+    print(f"OCBA selection by '{objective}' ({'max' if maximize else 'min'})")
+    for name in names:
+        print(f"{name}: mean {results['means'][name]}, runs {results['runs'][name]}")
+    print(f"Best: {results['best']}, PCS >= {pcs:.4f}, replications used: {used}")
+    print("-" * 10)
+
+    return results